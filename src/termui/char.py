@@ -1,13 +1,65 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from termui.color import Color
 
 
-@dataclass
+def _pack_color(color: Optional[Color]) -> int:
+    """Pack a color into a single integer.
+
+    Args:
+        color: The color to pack, or None for the terminal default.
+
+    Returns:
+        The 32-bit RGBA value of the color, or -1 if there is no color.
+    """
+    if color is None:
+        return -1
+    return color.r << 24 | color.g << 16 | color.b << 8 | color.a
+
+
+@dataclass(frozen=True, eq=False, slots=True)
 class Char:
     """Represents a character with optional foreground and background colors."""
 
     char: str
     fg_color: Optional[Color] = None
     bg_color: Optional[Color] = None
+    _key: tuple[str, int, int] = field(init=False, repr=False, compare=False)
+    """The character and its packed colors, compared instead of the fields."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_key",
+            (self.char, _pack_color(self.fg_color), _pack_color(self.bg_color)),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not Char:
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+
+@lru_cache(maxsize=4096)
+def get_char(
+    char: str, fg_color: Optional[Color] = None, bg_color: Optional[Color] = None
+) -> Char:
+    """Get a shared Char for a character and its colors.
+
+    Equal characters are returned as the same instance, so unchanged cells
+    can be recognised by identity instead of comparing their fields.
+
+    Args:
+        char: The character.
+        fg_color: The foreground color, if any.
+        bg_color: The background color, if any.
+
+    Returns:
+        The shared Char instance.
+    """
+    return Char(char, fg_color, bg_color)
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Color:
     """A class to represent a color with RGBA values.
 
@@ -106,6 +107,40 @@ class Color:
         )
 
 
+SGR_RESET = "\033[0m"
+"""The escape sequence that resets all colors to the terminal defaults."""
+
+
+@lru_cache(maxsize=4096)
+def sgr_prefix(
+    fg: Optional[Color] = None, bg: Optional[Color] = None, reset: bool = False
+) -> str:
+    """Get the ANSI escape sequence that selects a foreground and background color.
+
+    Both colors, and optionally a reset of the previous colors, are combined
+    into a single escape sequence. Results are cached per color pair, with
+    the cache bounded so that animated colors cannot grow it without limit.
+
+    Args:
+        fg: The foreground color. If None, no foreground color is selected.
+        bg: The background color. If None, no background color is selected.
+        reset: Whether to reset the previous colors before selecting new ones.
+
+    Returns:
+        The escape sequence, or an empty string if both fg and bg are None
+        and no reset is requested.
+    """
+    codes: list[str] = ["0"] if reset else []
+
+    if fg is not None:
+        codes.append(f"38;2;{fg.r};{fg.g};{fg.b}")
+
+    if bg is not None:
+        codes.append(f"48;2;{bg.r};{bg.g};{bg.b}")
+
+    return f"\033[{';'.join(codes)}m" if codes else ""
+
+
 def colorize(
     text: str,
     fg: Optional[Color] = None,
@@ -125,12 +160,4 @@ def colorize(
     if fg is None and bg is None:
         return text
 
-    codes: list[str] = []
-
-    if fg is not None:
-        codes.append(f"38;2;{fg.r};{fg.g};{fg.b}")
-
-    if bg is not None:
-        codes.append(f"48;2;{bg.r};{bg.g};{bg.b}")
-
-    return f"\033[{';'.join(codes)}m{text}\033[0m"
+    return f"{sgr_prefix(fg, bg)}{text}{SGR_RESET}"
@@ -1,11 +1,14 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import ClassVar, Optional
 
 
-@dataclass
+@dataclass(eq=False)
 class DOMNode:
     """A node in the DOM tree representing a widget hierarchy.
 
+    Nodes compare and hash by identity, so lookups in sets, dicts and child
+    lists never call back into Python.
+
     Args:
         id: Unique identifier for the node.
         name: Optional display name for the node.
@@ -25,12 +28,18 @@ class DOMNode:
     dirty: bool = field(default=True)
     """Whether the node needs re-rendering."""
 
-    def __hash__(self):
-        return hash(self.id)
+    structure_version: ClassVar[int] = 0
+    """Incremented whenever the children of any node change."""
+    dirty_version: ClassVar[int] = 0
+    """Incremented whenever any node is marked dirty."""
 
     def __repr__(self):
         return f"DOMNode(id={self.id!r}, children={len(self.children)})"
 
+    def _mark_structure_changed(self) -> None:
+        """Record that the children of this node have changed."""
+        DOMNode.structure_version += 1
+
     def set_parent(self, parent: "DOMNode") -> None:
         """Set the parent node for this node.
 
@@ -47,6 +56,7 @@ class DOMNode:
         """
         child.parent = self
         self.children.append(child)
+        self._mark_structure_changed()
 
     def add_children(self, *children: "DOMNode") -> None:
         """Add multiple child nodes to this node.
@@ -57,6 +67,7 @@ class DOMNode:
         for child in children:
             child.parent = self
             self.children.append(child)
+        self._mark_structure_changed()
 
     def remove_child(self, child: "DOMNode") -> None:
         """Remove a child node from this node.
@@ -64,13 +75,29 @@ class DOMNode:
         Args:
             child: The child node to remove. Its parent will be set to None.
         """
-        if child in self.children:
-            child.parent = None
+        # A single scan both finds and removes the child. Swap-and-pop would
+        # be O(1) but would reorder the children, which sets render order.
+        try:
             self.children.remove(child)
+        except ValueError:
+            return
+        child.parent = None
+        self._mark_structure_changed()
+
+    def clear_children(self) -> None:
+        """Remove all child nodes from this node.
+
+        The parent of each removed child will be set to None.
+        """
+        for child in self.children:
+            child.parent = None
+        self.children.clear()
+        self._mark_structure_changed()
 
     def mark_dirty(self) -> None:
         """Mark this node as dirty, indicating it needs to be re-rendered."""
         self.dirty = True
+        DOMNode.dirty_version += 1
 
     def mark_dirty_cascade_up(self) -> None:
         """Mark this node and all its ancestors as dirty.
@@ -78,9 +105,10 @@ class DOMNode:
         Propagates the dirty flag up the DOM tree to ensure parent
         nodes are also re-rendered when a child changes.
         """
-        self.mark_dirty()
-        if self.parent:
-            self.parent.mark_dirty_cascade_up()
+        node: Optional[DOMNode] = self
+        while node:
+            node.mark_dirty()
+            node = node.parent
 
     def mark_dirty_cascade_down(self) -> None:
         """Mark this node and all its descendants as dirty.
@@ -88,6 +116,8 @@ class DOMNode:
         Propagates the dirty flag down the DOM tree to ensure all
         child nodes are re-rendered when a parent changes.
         """
-        self.mark_dirty()
-        for child in self.children:
-            child.mark_dirty_cascade_down()
+        stack: list[DOMNode] = [self]
+        while stack:
+            node = stack.pop()
+            node.mark_dirty()
+            stack.extend(node.children)
@@ -26,6 +26,10 @@ class DOMTree:
         """A dictionary mapping node names to their corresponding DOM nodes."""
         self._layout_dirty = False
         """Whether the layout needs to be recalculated."""
+        self._node_list_cache: Optional[tuple[DOMNode, int, list[DOMNode]]] = None
+        """The last node list with the root and structure version it was built for."""
+        self._hit_test_cache: Optional[tuple[DOMNode, int, list[Widget]]] = None
+        """The standalone widgets in the last node list, for hit-testing."""
 
     def set_root(self, root: DOMNode) -> None:
         """Set the root of the DOM tree.
@@ -62,15 +66,19 @@ class DOMTree:
         Args:
             node: The node to add to the tracking structures.
         """
-        self.nodes.add(node)
-        self.nodes_by_id[node.id] = node
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            self.nodes.add(node)
+            self.nodes_by_id[node.id] = node
 
-        # Use name if available, otherwise fall back to ID
-        name_key = node.name if node.name else node.id
-        self.nodes_by_name[name_key] = node
+            # Use name if available, otherwise fall back to ID
+            name_key = node.name if node.name else node.id
+            self.nodes_by_name[name_key] = node
 
-        for child in node.children:
-            self._add_node_to_lookups(child)
+            # Reversed, so nodes are visited in the same pre-order as before
+            # and the last node with a shared name still wins.
+            stack.extend(reversed(node.children))
 
     def remove_node(self, node: DOMNode) -> None:
         """Remove a node from the DOM tree.
@@ -115,6 +123,9 @@ class DOMTree:
     def get_node_list(self) -> list[DOMNode]:
         """Get a list of nodes in breadth-first tree order.
 
+        The list is cached until the root or the structure of any node changes,
+        so it must not be modified by the caller.
+
         Returns:
             A list of all nodes in the tree, ordered by breadth-first traversal.
             Returns an empty list if there is no root node.
@@ -122,6 +133,11 @@ class DOMTree:
         if self.root is None:
             return []
 
+        if self._node_list_cache is not None:
+            root, version, node_list = self._node_list_cache
+            if root is self.root and version == DOMNode.structure_version:
+                return node_list
+
         queue = deque([self.root])
         node_list = []
 
@@ -131,6 +147,7 @@ class DOMTree:
             for child in current_node.children:
                 queue.append(child)
 
+        self._node_list_cache = (self.root, DOMNode.structure_version, node_list)
         return node_list
 
     def get_node_at_coordinate(self, x: int, y: int) -> Optional[DOMNode]:
@@ -160,16 +177,34 @@ class DOMTree:
         Returns:
             The Widget at the specified position, or None if not found.
         """
-        for node in self.get_node_list():
-            if (
-                isinstance(node, Widget)
-                and node.region.contains(x, y)
-                and not isinstance(node, Layout)
-                and not isinstance(node, Container)
-            ):
-                return node
+        for widget in self._get_hit_test_widgets():
+            if widget.region.contains(x, y):
+                return widget
         return None
 
+    def _get_hit_test_widgets(self) -> list[Widget]:
+        """Get the standalone widgets in breadth-first tree order.
+
+        Layouts and containers are filtered out once per structure change
+        rather than on every hit-test, since mouse events arrive far more
+        often than the tree changes.
+
+        Returns:
+            The widgets that can be returned by a hit-test.
+        """
+        if self._hit_test_cache is not None:
+            root, version, widgets = self._hit_test_cache
+            if root is self.root and version == DOMNode.structure_version:
+                return widgets
+
+        widgets = [
+            node
+            for node in self.get_node_list()
+            if isinstance(node, Widget) and not isinstance(node, (Layout, Container))
+        ]
+        self._hit_test_cache = (self.root, DOMNode.structure_version, widgets)
+        return widgets
+
     def get_tree_string(self, node: Optional[DOMNode] = None, indent: int = 0) -> str:
         """Get a string representation of the DOM tree for debugging.
 
@@ -187,39 +222,34 @@ class DOMTree:
         if node is None:
             node = self.root
 
-        if not isinstance(node, Widget):
-            return "<non-widget node>"
-
-        node = cast(Widget, node)
-
-        node_width = node.region.width
-        node_height = node.region.height
-        node_x = node.region.x
-        node_y = node.region.y
-
-        lines = [
-            " " * indent
-            + f"{node.name} ({node.id}) ({node_width}x{node_height}) (Coords: {node_x}, {node_y})"
-        ]
-        for child in node.children:
-            lines.append(self.get_tree_string(child, indent + 2))
-        return "\n".join(line for line in lines if line)
+        lines: list[str] = []
+        # Children are pushed in reverse so they are visited in order.
+        stack: list[tuple[DOMNode, int]] = [(cast(DOMNode, node), indent)]
+        while stack:
+            current, current_indent = stack.pop()
+
+            if not isinstance(current, Widget):
+                lines.append("<non-widget node>")
+                continue
+
+            region = current.region
+            lines.append(
+                " " * current_indent
+                + f"{current.name} ({current.id}) ({region.width}x{region.height}) (Coords: {region.x}, {region.y})"
+            )
+            stack.extend(
+                (child, current_indent + 2) for child in reversed(current.children)
+            )
+        return "\n".join(lines)
 
     def arrange_all_widgets(self) -> None:
-        """Arrange all widgets using BFS traversal."""
+        """Arrange all layouts in breadth-first order, parents before children."""
         if not self._layout_dirty or not self.root:
             return
 
-        queue = deque([self.root])
-
-        while queue:
-            current = queue.popleft()
-
-            if isinstance(current, Layout):
-                current.arrange()
-
-            for child in current.children:
-                queue.append(child)
+        for node in self.get_node_list():
+            if isinstance(node, Layout):
+                node.arrange()
 
         self._layout_dirty = False
 
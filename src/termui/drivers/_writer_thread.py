@@ -55,7 +55,9 @@ class WriterThread(threading.Thread):
             text: str | None = self._queue.get()
             if text is None:
                 break
-            data = text.encode()
+            # Frames arrive as one large payload; a memoryview lets partial
+            # writes advance through it without copying the remainder.
+            data = memoryview(text.encode())
             while data:
                 try:
                     written = os.write(self.fileno(), data)
@@ -30,6 +30,8 @@ class Layout(Widget):
 
         self._arrangement_needed = True
         """Whether the layout needs to be arranged."""
+        self._arranged_state: Optional[tuple] = None
+        """The layout's region, spacing and child regions as they were left by the last arrange."""
 
     def __call__(self, *children: Widget) -> "Layout":
         """Make the layout callable to accept child widgets.
@@ -38,6 +40,7 @@ class Layout(Widget):
             *children: Variable number of child widgets to include in the layout.
         """
         self.children.extend(children)
+        self._mark_structure_changed()
         return self
 
     def _mark_arrangement_needed(self) -> None:
@@ -45,6 +48,41 @@ class Layout(Widget):
         self._arrangement_needed = True
         self.mark_dirty_cascade_up()
 
+    def _get_arrangement_state(self) -> tuple:
+        """Capture everything that determines how the children are arranged.
+
+        Returns:
+            A tuple of the layout's region and spacing, and each child with
+            its current region.
+        """
+        region = self.region
+        return (
+            region.x,
+            region.y,
+            region.width,
+            region.height,
+            self.spacing,
+            tuple(
+                (
+                    child,
+                    child.region.x,
+                    child.region.y,
+                    child.region.width,
+                    child.region.height,
+                )
+                for child in self.children
+            ),
+        )
+
+    def _is_arranged(self) -> bool:
+        """Check whether nothing has changed since the last arrange.
+
+        Returns:
+            True if the layout and its children are exactly as the last
+            arrange left them, so arranging again would be a no-op.
+        """
+        return self._arranged_state == self._get_arrangement_state()
+
     @abstractmethod
     def arrange(self) -> None:
         """Arrange the child widgets according to the layout's rules.
@@ -80,6 +118,7 @@ class Layout(Widget):
             child: The child widget to add.
         """
         self.children.append(child)
+        self._mark_structure_changed()
         self._mark_arrangement_needed()
 
     def remove_child(self, child: Widget) -> None:
@@ -89,4 +128,5 @@ class Layout(Widget):
             child: The child widget to remove.
         """
         self.children.remove(child)
+        self._mark_structure_changed()
         self._mark_arrangement_needed()
@@ -1,8 +1,53 @@
+from itertools import accumulate
+from typing import Optional
+
 from termui.errors import LayoutError
 from termui.layout import Layout
 from termui.widget import Widget
 
 
+def _normalize_span(position: int | tuple[int, int]) -> tuple[int, int]:
+    """Normalize a grid position into a start index and a span.
+
+    Args:
+        position: A single 1-based index, or an inclusive (start, end) range.
+
+    Returns:
+        A tuple (start, span) where start is 1-based.
+    """
+    if isinstance(position, tuple):
+        start, end = position
+        return start, end - start + 1
+    return position, 1
+
+
+def _distribute(sizes: list[int], extra: int) -> list[int]:
+    """Distribute extra space evenly across cells.
+
+    Any remainder is given one unit at a time to the first cells.
+
+    Args:
+        sizes: The current size of each cell.
+        extra: The extra space to distribute. Nothing is distributed if it
+            is not positive.
+
+    Returns:
+        The cell sizes with the extra space added.
+    """
+    if extra <= 0 or not sizes:
+        return sizes
+
+    extra_per_cell, remainder = divmod(extra, len(sizes))
+    if remainder == 0:
+        # Every cell grows by the same amount.
+        return [size + extra_per_cell for size in sizes]
+
+    return [
+        size + extra_per_cell + (1 if i < remainder else 0)
+        for i, size in enumerate(sizes)
+    ]
+
+
 class GridLayout(Layout):
     """A grid layout that arranges widgets in a grid format.
 
@@ -23,9 +68,44 @@ class GridLayout(Layout):
             {}
         )  # widget -> (row, col, row_span, col_span)
         """A mapping of widgets to their grid positions and spans."""
+        self._layout_version: int = 0
+        """Incremented whenever the span map changes."""
+        self._grid_dimensions: Optional[tuple[int, tuple[int, int]]] = None
+        """The cached grid dimensions and the layout version they were computed for."""
 
         super().__init__(name="GridLayout", **kwargs)
 
+    def __call__(self, *children: Widget) -> "GridLayout":
+        """Make the layout callable to accept child widgets.
+
+        Args:
+            *children: Variable number of child widgets to include in the layout.
+        """
+        self._add_children_to_span_map(*children)
+        super().__call__(*children)
+        return self
+
+    def add_child(self, child: Widget) -> None:
+        """Add a child widget to the layout and place it in the grid.
+
+        Args:
+            child: The child widget to add.
+
+        Raises:
+            LayoutError: If the child widget's position overlaps with existing widgets.
+        """
+        self._add_child_to_span_map(child)
+        super().add_child(child)
+
+    def remove_child(self, child: Widget) -> None:
+        """Remove a child widget from the layout and free its grid cells.
+
+        Args:
+            child: The child widget to remove.
+        """
+        super().remove_child(child)
+        self._remove_child_from_span_map(child)
+
     def calculate_minimum_size(self) -> tuple[int, int]:
         """Calculate minimum size needed for the grid layout."""
         return self._calculate_minimum_size()
@@ -44,49 +124,73 @@ class GridLayout(Layout):
             return
 
         child_row, child_col = child.grid_pos
-
-        # Handle row specification
-        if isinstance(child_row, tuple):
-            row = child_row[0]
-            row_span = child_row[1] - child_row[0] + 1
-        else:
-            row = child_row
-            row_span = 1
-
-        # Handle column specification
-        if isinstance(child_col, tuple):
-            col = child_col[0]
-            col_span = child_col[1] - child_col[0] + 1
-        else:
-            col = child_col
-            col_span = 1
+        row, row_span = _normalize_span(child_row)
+        col, col_span = _normalize_span(child_col)
 
         # Convert to 0-based indexing
         row_0_index = row - 1
         col_0_index = col - 1
 
-        # Check for overlaps and populate grid_map
-        for r in range(row_0_index, row_0_index + row_span):
-            for c in range(col_0_index, col_0_index + col_span):
-                if (r, c) in self.grid_map:
-                    raise LayoutError(
-                        f"Trying to place widget {child.name} at grid position ({r}, {c}). "
-                        f"Already occupied by {self.grid_map[(r, c)].name}. "
-                        f"Row: {row}, Col: {col}, Row Span: {row_span}, Col Span: {col_span}"
-                    )
-                self.grid_map[(r, c)] = child
+        cells = [
+            (r, c)
+            for r in range(row_0_index, row_0_index + row_span)
+            for c in range(col_0_index, col_0_index + col_span)
+        ]
+
+        # Check every cell for overlaps before occupying any of them, so a
+        # rejected child leaves the grid map untouched.
+        for r, c in cells:
+            if (r, c) in self.grid_map:
+                raise LayoutError(
+                    f"Trying to place widget {child.name} at grid position ({r}, {c}). "
+                    f"Already occupied by {self.grid_map[(r, c)].name}. "
+                    f"Row: {row}, Col: {col}, Row Span: {row_span}, Col Span: {col_span}"
+                )
+
+        for cell in cells:
+            self.grid_map[cell] = child
 
         self.span_map[child] = (row_0_index, col_0_index, row_span, col_span)
+        self._layout_version += 1
         child.set_position(0, 0)  # Initial position; will be updated in arrange()
 
+    def _remove_child_from_span_map(self, child: Widget) -> None:
+        """Remove a child widget and the grid cells it occupies from the span map.
+
+        Args:
+            child: The child widget to remove.
+        """
+        span = self.span_map.pop(child, None)
+        if span is None:
+            return
+
+        row, col, row_span, col_span = span
+        for r in range(row, row + row_span):
+            for c in range(col, col + col_span):
+                self.grid_map.pop((r, c), None)
+
+        self._layout_version += 1
+
     def _add_children_to_span_map(self, *children: Widget) -> None:
-        """Recursively adds child widgets to the span map.
+        """Add child widgets to the span map, all or none.
 
         Args:
             *children: The child widgets to add.
+
+        Raises:
+            LayoutError: If any child's position overlaps with existing widgets.
+                The children placed before it are removed again.
         """
-        for child in children:
-            self._add_child_to_span_map(child)
+        placed: list[Widget] = []
+        try:
+            for child in children:
+                if child not in self.span_map:
+                    self._add_child_to_span_map(child)
+                    placed.append(child)
+        except LayoutError:
+            for child in placed:
+                self._remove_child_from_span_map(child)
+            raise
 
     def _calculate_grid_dimensions(self) -> tuple[int, int]:
         """Calculate the required grid dimensions based on widget positions.
@@ -95,13 +199,20 @@ class GridLayout(Layout):
             A tuple (max_rows, max_cols) representing the minimum grid size
             needed to accommodate all widgets.
         """
-        if not self.grid_map:
-            return 1, 1
+        if self._grid_dimensions is not None:
+            version, dimensions = self._grid_dimensions
+            if version == self._layout_version:
+                return dimensions
 
-        max_row = max(pos[0] for pos in self.grid_map) + 1
-        max_col = max(pos[1] for pos in self.grid_map) + 1
+        if not self.grid_map:
+            dimensions = (1, 1)
+        else:
+            max_row = max(pos[0] for pos in self.grid_map) + 1
+            max_col = max(pos[1] for pos in self.grid_map) + 1
+            dimensions = (max_row, max_col)
 
-        return max_row, max_col
+        self._grid_dimensions = (self._layout_version, dimensions)
+        return dimensions
 
     def _calculate_cell_sizes(
         self, max_rows: int, max_cols: int
@@ -121,10 +232,7 @@ class GridLayout(Layout):
 
         # Calculate minimum sizes based on widget content
         for widget, (row, col, row_span, col_span) in self.span_map.items():
-            if hasattr(widget, "get_minimum_size"):
-                min_width, min_height = widget.get_minimum_size()
-            else:
-                min_width, min_height = widget.region.width, widget.region.height
+            min_width, min_height = widget.get_minimum_size()
 
             # For single-cell widgets, update the cell size directly
             if row_span == 1 and col_span == 1:
@@ -157,23 +265,48 @@ class GridLayout(Layout):
         max_rows, max_cols = self._calculate_grid_dimensions()
         row_heights, col_widths = self._calculate_cell_sizes(max_rows, max_cols)
 
-        total_width = sum(col_widths) + (self.spacing * max(0, max_cols - 1))
-        total_height = sum(row_heights) + (self.spacing * max(0, max_rows - 1))
+        return self._calculate_total_size(row_heights, col_widths)
+
+    def _calculate_total_size(
+        self, row_heights: list[int], col_widths: list[int]
+    ) -> tuple[int, int]:
+        """Calculate the total size of the grid from its cell sizes.
+
+        Args:
+            row_heights: The height of each row.
+            col_widths: The width of each column.
+
+        Returns:
+            A tuple (total_width, total_height) including spacing between cells.
+        """
+        total_width = sum(col_widths) + (self.spacing * max(0, len(col_widths) - 1))
+        total_height = sum(row_heights) + (self.spacing * max(0, len(row_heights) - 1))
 
         return total_width, total_height
 
+    def _get_arrangement_state(self) -> tuple:
+        """Capture everything that determines how the children are arranged.
+
+        Returns:
+            The base arrangement state, plus the span map version and the
+            minimum size of each placed child, which determine the cell sizes.
+        """
+        return (
+            *super()._get_arrangement_state(),
+            self._layout_version,
+            tuple(widget.get_minimum_size() for widget in self.span_map),
+        )
+
     def arrange(self) -> None:
         """Arrange the widgets in the grid."""
-        if not self.children:
+        if not self.children or self._is_arranged():
             return
 
-        self._add_children_to_span_map(*self.children)
-
         max_rows, max_cols = self._calculate_grid_dimensions()
         row_heights, col_widths = self._calculate_cell_sizes(max_rows, max_cols)
 
-        # Calculate minimum size
-        min_width, min_height = self._calculate_minimum_size()
+        # Calculate minimum size from the cell sizes computed above
+        min_width, min_height = self._calculate_total_size(row_heights, col_widths)
 
         # Ensure grid is at least minimum size
         self.region.width = max(self.region.width, min_width)
@@ -189,56 +322,32 @@ class GridLayout(Layout):
         total_min_width = sum(col_widths)
         total_min_height = sum(row_heights)
 
-        extra_width = max(0, available_width - total_min_width)
-        if extra_width > 0 and max_cols > 0:
-            extra_per_col = extra_width // max_cols
-            remainder_width = extra_width % max_cols
-            for i in range(max_cols):
-                col_widths[i] += extra_per_col
-                if i < remainder_width:
-                    col_widths[i] += 1
-
-        extra_height = max(0, available_height - total_min_height)
-        if extra_height > 0 and max_rows > 0:
-            extra_per_row = extra_height // max_rows
-            remainder_height = extra_height % max_rows
-            for i in range(max_rows):
-                row_heights[i] += extra_per_row
-                if i < remainder_height:
-                    row_heights[i] += 1
-
-        # Calculate row and column positions
-        row_positions = [0]
-        for i, height in enumerate(row_heights[:-1]):
-            row_positions.append(row_positions[-1] + height + self.spacing)
-
-        col_positions = [0]
-        for i, width in enumerate(col_widths[:-1]):
-            col_positions.append(col_positions[-1] + width + self.spacing)
+        col_widths = _distribute(col_widths, available_width - total_min_width)
+        row_heights = _distribute(row_heights, available_height - total_min_height)
+
+        # Prefix sums of the cell sizes: offsets[i] is the total size of
+        # the first i cells, excluding spacing.
+        row_offsets = list(accumulate(row_heights, initial=0))
+        col_offsets = list(accumulate(col_widths, initial=0))
+        spacing = self.spacing
 
         # Position each widget
-        positioned_widgets = set()
         for widget, (row, col, row_span, col_span) in self.span_map.items():
-            if widget in positioned_widgets:
-                continue
-
             # Calculate widget position
-            x = self.region.x + col_positions[col]
-            y = self.region.y + row_positions[row]
+            x = self.region.x + col_offsets[col] + spacing * col
+            y = self.region.y + row_offsets[row] + spacing * row
 
             # Calculate widget size (sum of spanned cells plus spacing)
-            width = sum(col_widths[col : col + col_span])
-            if col_span > 1:
-                width += self.spacing * (col_span - 1)
+            width = col_offsets[col + col_span] - col_offsets[col]
+            width += spacing * (col_span - 1)
 
-            height = sum(row_heights[row : row + row_span])
-            if row_span > 1:
-                height += self.spacing * (row_span - 1)
+            height = row_offsets[row + row_span] - row_offsets[row]
+            height += spacing * (row_span - 1)
 
             # Set widget position and size
             widget.set_position(x, y)
             widget.set_size(width, height)
 
-            positioned_widgets.add(widget)
+        self._arranged_state = self._get_arrangement_state()
 
         self.mark_dirty()
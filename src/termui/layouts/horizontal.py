@@ -1,3 +1,5 @@
+from itertools import accumulate
+
 from termui.layout import Layout
 
 
@@ -14,31 +16,47 @@ class HorizontalLayout(Layout):
 
     def calculate_minimum_size(self) -> tuple[int, int]:
         """Calculate minimum size needed for horizontal layout."""
-        if not self.children:
-            return 0, 0
+        _, min_width, min_height = self._measure_children()
+        return min_width, min_height
+
+    def _measure_children(self) -> tuple[list[int], int, int]:
+        """Measure the children in a single pass.
 
-        total_width = sum(child.region.width for child in self.children)
-        total_width += self.spacing * max(0, len(self.children) - 1)
-        max_height = (
-            max(child.region.height for child in self.children) if self.children else 0
-        )
+        Returns:
+            A tuple (widths, min_width, min_height) containing the width of
+            each child and the minimum size of the layout.
+        """
+        widths: list[int] = []
+        max_height = 0
+        for child in self.children:
+            region = child.region
+            widths.append(region.width)
+            max_height = max(max_height, region.height)
 
-        return total_width, max_height
+        total_width = sum(widths) + self.spacing * max(0, len(widths) - 1)
+
+        return widths, total_width, max_height
 
     def arrange(self) -> None:
         """Arrange the widgets horizontally."""
-        if not self.children:
+        children = self.children
+        if not children or self._is_arranged():
             return
 
-        min_width, min_height = self.calculate_minimum_size()
+        widths, min_width, min_height = self._measure_children()
 
-        self.region.width = max(self.region.width, min_width)
-        self.region.height = max(self.region.height, min_height)
+        region = self.region
+        region.width = max(region.width, min_width)
+        region.height = max(region.height, min_height)
 
-        x_offset = 0
-        for child in self.children:
-            child.set_position(self.region.x + x_offset, self.region.y)
-            child.set_size(child.region.width, self.region.height)
-            x_offset += child.region.width + self.spacing
+        # Prefix sums of the child widths give each child's offset.
+        spacing = self.spacing
+        x_offsets = list(accumulate((width + spacing for width in widths), initial=0))
+        x, y, height = region.x, region.y, region.height
+        for child, width, x_offset in zip(children, widths, x_offsets):
+            child.set_position(x + x_offset, y)
+            child.set_size(width, height)
+
+        self._arranged_state = self._get_arrangement_state()
 
         self.mark_dirty()
@@ -1,3 +1,5 @@
+from itertools import accumulate
+
 from termui.layout import Layout
 
 
@@ -14,31 +16,49 @@ class VerticalLayout(Layout):
 
     def calculate_minimum_size(self) -> tuple[int, int]:
         """Calculate minimum size needed for vertical layout."""
-        if not self.children:
-            return 0, 0
+        _, min_width, min_height = self._measure_children()
+        return min_width, min_height
 
-        max_width = (
-            max(child.region.width for child in self.children) if self.children else 0
-        )
-        total_height = sum(child.region.height for child in self.children)
-        total_height += self.spacing * max(0, len(self.children) - 1)
+    def _measure_children(self) -> tuple[list[int], int, int]:
+        """Measure the children in a single pass.
+
+        Returns:
+            A tuple (heights, min_width, min_height) containing the height of
+            each child and the minimum size of the layout.
+        """
+        heights: list[int] = []
+        max_width = 0
+        for child in self.children:
+            region = child.region
+            heights.append(region.height)
+            max_width = max(max_width, region.width)
 
-        return max_width, total_height
+        total_height = sum(heights) + self.spacing * max(0, len(heights) - 1)
+
+        return heights, max_width, total_height
 
     def arrange(self) -> None:
         """Arrange the widgets vertically."""
-        if not self.children:
+        children = self.children
+        if not children or self._is_arranged():
             return
 
-        min_width, min_height = self.calculate_minimum_size()
+        heights, min_width, min_height = self._measure_children()
 
-        self.region.width = max(self.region.width, min_width)
-        self.region.height = max(self.region.height, min_height)
+        region = self.region
+        region.width = max(region.width, min_width)
+        region.height = max(region.height, min_height)
 
-        y_offset = 0
-        for child in self.children:
-            child.set_position(self.region.x, self.region.y + y_offset)
-            child.set_size(self.region.width, child.region.height)
-            y_offset += child.region.height + self.spacing
+        # Prefix sums of the child heights give each child's offset.
+        spacing = self.spacing
+        y_offsets = list(
+            accumulate((height + spacing for height in heights), initial=0)
+        )
+        x, y, width = region.x, region.y, region.width
+        for child, height, y_offset in zip(children, heights, y_offsets):
+            child.set_position(x, y + y_offset)
+            child.set_size(width, height)
+
+        self._arranged_state = self._get_arrangement_state()
 
         self.mark_dirty()
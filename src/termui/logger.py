@@ -1,5 +1,6 @@
+import atexit
 import os
-from typing import Optional
+from typing import Optional, TextIO
 
 
 class Logger:
@@ -30,25 +31,41 @@ class Logger:
         self.stderr = stderr
         """Whether to enable stderr logging."""
 
+        self._file: Optional[TextIO] = None
+        """The open log file handle, kept open for the lifetime of the logger."""
+
         if self.log_file:
             if not os.path.exists(os.path.dirname(self.log_file)):
                 os.makedirs(os.path.dirname(self.log_file))
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.seek(0)
-                f.truncate()
-                f.write("[TermUI Logger Initialized]\n")
-
-    def _write_to_file(self, message: str) -> None:
+            # Line buffering flushes each message without reopening the file.
+            # The handle lives as long as the logger and is closed at exit, so
+            # it cannot be scoped to a with block.
+            self._file = open(  # pylint: disable=consider-using-with
+                self.log_file, "w", encoding="utf-8", buffering=1
+            )
+            self._file.write("[TermUI Logger Initialized]\n")
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Close the log file. Messages logged afterwards are discarded."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write_to_file(self, prefix: str, message: str | Exception) -> None:
         """Write a log message to the log file.
 
+        The prefix and message are written as separate pieces, so no
+        intermediate string is built for each message.
+
         Args:
+            prefix: The level prefix to write before the message.
             message: The message to log.
         """
-        if self.log_file:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(f"{message}\n")
-        else:
-            print(message)
+        if self._file is not None:
+            self._file.writelines((prefix, str(message), "\n"))
+        elif not self.log_file:
+            print(prefix, message, sep="")
 
     def system(self, message: str) -> None:
         """Log a system message.
@@ -57,7 +74,7 @@ class Logger:
             message: The message to log with a "[Log]" prefix.
         """
         if self.stdout:
-            self._write_to_file(f"[Log] {message}")
+            self._write_to_file("[Log] ", message)
 
     def debug(self, message: str) -> None:
         """Log a debug message.
@@ -66,7 +83,7 @@ class Logger:
             message: The message to log with a "[Debug]" prefix.
         """
         if self.stdout:
-            self._write_to_file(f"[Debug] {message}")
+            self._write_to_file("[Debug] ", message)
 
     def warning(self, message: str) -> None:
         """Log a warning message.
@@ -75,7 +92,7 @@ class Logger:
             message: The warning message to log with a "[Warning]" prefix.
         """
         if self.stdout:
-            self._write_to_file(f"[Warning] {message}")
+            self._write_to_file("[Warning] ", message)
 
     def error(self, message: str | Exception) -> None:
         """Log an error message.
@@ -84,7 +101,7 @@ class Logger:
             message: The error message or exception to log with a "[Error]" prefix.
         """
         if self.stderr:
-            self._write_to_file(f"[Error] {message}")
+            self._write_to_file("[Error] ", message)
 
 
 log = Logger("logs/log.txt")
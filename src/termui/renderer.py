@@ -1,8 +1,9 @@
 from typing import Optional
 
 from termui._context_manager import app
-from termui.char import Char
-from termui.color import Color, colorize
+from termui.char import Char, get_char
+from termui.color import SGR_RESET, Color, sgr_prefix
+from termui.dom_node import DOMNode
 from termui.dom_tree import DOMTree
 from termui.drivers._driver import Driver
 from termui.logger import log
@@ -10,6 +11,9 @@ from termui.screen import Screen
 from termui.utils.geometry import Region
 from termui.widget import Widget
 
+_MAX_REWRITTEN_GAP = 4
+"""The widest run of unchanged cells rewritten instead of moving the cursor past it."""
+
 
 class FrameBuffer:
     """A double-buffered frame buffer for efficient terminal rendering.
@@ -38,33 +42,39 @@ class FrameBuffer:
         """Background color of the frame buffer."""
 
         self._create_empty_char()
-        self.current_frame = [
-            [self._get_empty_char() for _ in range(width)] for _ in range(height)
-        ]
+        self.current_frame = self._create_frame(width, height)
         """The currently rendered frame."""
-        self.previous_frame = [
-            [self._get_empty_char() for _ in range(width)] for _ in range(height)
-        ]
+        self.previous_frame = self._create_frame(width, height)
         """The previous rendered frame."""
-        self.dirty_regions: set[tuple[int, int, int, int]] = set()  # (x, y, w, h)
-        """Any regions of the screen marked as needing re-rendering."""
+        self.dirty_rows: dict[int, tuple[int, int]] = {}
+        """The (start_x, end_x) column span touched in each dirty row. Only these cells are diffed.
+
+        Dirty rectangles are merged into these spans as they are marked, so
+        overlapping regions never cost more than one pass over their cells.
+        """
         self.inline: bool = True
         """Whether to resize the terminal to the content size.
         Determined by 'screen.inline' in the renderer.
         """
 
     def _create_empty_char(self) -> None:
-        """Create the base empty character with background color."""
-        self._empty_char = Char(" ", None, self.background_color)
+        """Look up the shared empty character for the background color."""
+        self._empty_char = get_char(" ", None, self.background_color)
+
+    def _create_frame(self, width: int, height: int) -> list[list[Char]]:
+        """Create a frame filled with the empty character.
 
-    def _get_empty_char(self) -> Char:
-        """Get a new empty character with the current background color.
+        Char is immutable, so every cell refers to the same empty character
+        and each row is filled in a single C-level operation.
+
+        Args:
+            width: The width of the frame in characters.
+            height: The height of the frame in characters.
 
         Returns:
-            A new Char instance representing an empty space with the
-            current background color.
+            A new frame of empty characters.
         """
-        return Char(" ", None, self.background_color)
+        return [[self._empty_char] * width for _ in range(height)]
 
     def set_size(self, width: int, height: int) -> None:
         """Set the size of the frame buffer.
@@ -75,12 +85,10 @@ class FrameBuffer:
         """
         self.width = width
         self.height = height
-        self.current_frame = [
-            [self._get_empty_char() for _ in range(width)] for _ in range(height)
-        ]
-        self.previous_frame = [
-            [self._get_empty_char() for _ in range(width)] for _ in range(height)
-        ]
+        self.current_frame = self._create_frame(width, height)
+        self.previous_frame = self._create_frame(width, height)
+        # Both frames are blank, so no row differs.
+        self.dirty_rows.clear()
 
     def set_background_color(self, color: Optional[Color]) -> None:
         """Set the background color of the frame buffer.
@@ -90,15 +98,17 @@ class FrameBuffer:
         """
         self.background_color = color
         self._create_empty_char()
+        empty_char = self._empty_char
         for row in self.current_frame:
-            for i, char in enumerate(row):
-                if char.char == " " and char.fg_color is None:
-                    row[i] = self._get_empty_char()
+            row[:] = [
+                empty_char if char.char == " " and char.fg_color is None else char
+                for char in row
+            ]
         self.mark_entire_screen_dirty()
 
     def mark_entire_screen_dirty(self) -> None:
         """Mark the entire screen as dirty for full redraw."""
-        self.dirty_regions.add((0, 0, self.width, self.height))
+        self.dirty_rows = dict.fromkeys(range(self.height), (0, self.width))
 
     def mark_region_dirty(self, region: Region) -> None:
         """Mark a specific region as dirty for redraw.
@@ -113,14 +123,37 @@ class FrameBuffer:
         h = min(region.height, self.height - y)
 
         if w > 0 and h > 0:
-            self.dirty_regions.add((x, y, w, h))
+            self._mark_rows_dirty(x, y, w, h)
+
+    def _mark_rows_dirty(self, x: int, y: int, width: int, height: int) -> None:
+        """Widen the dirty span of each row covered by an in-bounds rectangle.
+
+        Args:
+            x: The x-coordinate of the rectangle.
+            y: The y-coordinate of the rectangle.
+            width: The width of the rectangle.
+            height: The height of the rectangle.
+        """
+        end_x = x + width
+        dirty_rows = self.dirty_rows
+        for row in range(y, y + height):
+            span = dirty_rows.get(row)
+            if span is None:
+                dirty_rows[row] = (x, end_x)
+            elif x < span[0] or end_x > span[1]:
+                dirty_rows[row] = (min(x, span[0]), max(end_x, span[1]))
 
     def clear(self) -> None:
-        """Clear the current frame buffer to empty characters."""
-        for row in self.current_frame:
-            for i, _ in enumerate(row):
-                row[i] = self._get_empty_char()
-        self.mark_entire_screen_dirty()
+        """Clear the current frame buffer to empty characters.
+
+        Only rows that held content are reset and marked dirty, so clearing
+        an already blank frame produces no output.
+        """
+        empty_row = [self._empty_char] * self.width
+        for y, row in enumerate(self.current_frame):
+            if row != empty_row:
+                row[:] = empty_row
+                self._mark_rows_dirty(0, y, self.width, 1)
 
     def draw_char(self, x: int, y: int, char: Char) -> None:
         """Draw a character at the specified position.
@@ -132,42 +165,63 @@ class FrameBuffer:
         """
         if 0 <= x < self.width and 0 <= y < self.height:
             if char.bg_color is None and self.background_color is not None:
-                char = Char(char.char, char.fg_color, self.background_color)
+                char = get_char(char.char, char.fg_color, self.background_color)
 
             if self.current_frame[y][x] != char:
                 self.current_frame[y][x] = char
-                self.mark_region_dirty(Region(x, y, 1, 1))
+                # The cell is already known to be in bounds, so no clamping is needed.
+                self._mark_rows_dirty(x, y, 1, 1)
 
-    def draw_content(
-        self, region: Region, content: list[list[Char]], clip: bool = True
-    ) -> None:
+    def draw_content(self, region: Region, content: list[list[Char]]) -> None:
         """Draw content to the frame buffer.
 
+        Content is always clipped to the frame buffer boundaries. Only the rows
+        that differ from the current frame are copied and marked dirty.
+
         Args:
             region: The region where the content should be drawn.
             content: A 2D list of Char objects representing the content.
-            clip: Whether to clip content to the frame buffer boundaries.
         """
         abs_x, abs_y = region.x, region.y
-
-        for row_idx, row in enumerate(content):
-            y = abs_y + row_idx
-            if clip and (y < 0 or y >= self.height):
+        background_color = self.background_color
+        current_frame = self.current_frame
+
+        # Clip the content to the frame buffer once, rather than per row or
+        # per cell. Rows may differ in length, so only their end is per row.
+        first_row = max(0, -abs_y)
+        last_row = min(len(content), self.height - abs_y)
+        start = max(0, -abs_x)
+        max_end = self.width - abs_x
+
+        for row_idx in range(first_row, last_row):
+            row = content[row_idx]
+            end = min(len(row), max_end)
+            if start >= end:
                 continue
 
-            for col_idx, char in enumerate(row):
-                x = abs_x + col_idx
-                if clip and (x < 0 or x >= self.width):
-                    continue
-
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    if char.bg_color is None and self.background_color is not None:
-                        char = Char(char.char, char.fg_color, self.background_color)
-
-                    if self.current_frame[y][x] != char:
-                        self.current_frame[y][x] = char
+            segment = row[start:end]
+            if background_color is not None and any(
+                char.bg_color is None for char in segment
+            ):
+                segment = [
+                    (
+                        get_char(char.char, char.fg_color, background_color)
+                        if char.bg_color is None
+                        else char
+                    )
+                    for char in segment
+                ]
 
-        self.mark_region_dirty(region)
+            # Widgets are redrawn whenever they are dirty, but their output is
+            # often unchanged. Such rows are left alone and not marked dirty,
+            # so they cost neither a copy nor a diff.
+            y = abs_y + row_idx
+            x0 = abs_x + start
+            x1 = abs_x + end
+            target_row = current_frame[y]
+            if target_row[x0:x1] != segment:
+                target_row[x0:x1] = segment
+                self._mark_rows_dirty(x0, y, x1 - x0, 1)
 
     def get_rendered_output(self) -> list[str]:
         """Render only changed characters to the terminal.
@@ -175,34 +229,78 @@ class FrameBuffer:
         Uses differential rendering to only update characters that have
         changed since the last frame, improving performance.
         """
-        if not self.dirty_regions:
+        if not self.dirty_rows:
             return []
 
         output: list[str] = []
+        # Each frame starts in the terminal's default style, since the
+        # previous frame ended with a reset.
+        style: tuple[Optional[Color], Optional[Color]] = (None, None)
+        style_active = False
+
+        # Cells outside the dirty regions were not drawn to since the last frame.
+        dirty_rows = sorted(self.dirty_rows.items())
+
+        for y, (start_x, end_x) in dirty_rows:
+            current_row = self.current_frame[y]
+            previous_row = self.previous_frame[y]
+            # Whole-row comparison runs in C; most rows are unchanged.
+            if current_row == previous_row:
+                continue
 
-        def move_cursor(x: int, y: int) -> None:
-            output.append(f"\033[{y};{x}H")
-
-        for y in range(self.height):
-            for x in range(self.width):
-                current_char = self.current_frame[y][x]
-                previous_char = self.previous_frame[y][x]
-
-                if current_char != previous_char:
-                    move_cursor(x + 1, y + 1)
-                    output.append(
-                        colorize(
-                            current_char.char,
-                            fg=current_char.fg_color,
-                            bg=current_char.bg_color,
-                        )
-                    )
+            cursor_x = -1
+            row_output: list[str] = []
 
-        for y in range(self.height):
-            for x in range(self.width):
-                self.previous_frame[y][x] = self.current_frame[y][x]
+            for x in range(start_x, end_x):
+                char = current_row[x]
+                previous_char = previous_row[x]
+                if char is previous_char or char == previous_char:
+                    continue
 
-        self.dirty_regions.clear()
+                # Adjacent changed cells continue where the last one left off.
+                # A short gap of unchanged cells in the current style is
+                # rewritten as-is, which is cheaper than a cursor move. Other
+                # gaps within the row are skipped with a relative move, which
+                # is shorter than an absolute one.
+                if x != cursor_x:
+                    gap = current_row[cursor_x:x] if cursor_x >= 0 else ()
+                    if not gap:
+                        row_output.append(f"\033[{y + 1};{x + 1}H")
+                    elif len(gap) <= _MAX_REWRITTEN_GAP and all(
+                        len(cell.char) == 1
+                        and cell.fg_color == style[0]
+                        and cell.bg_color == style[1]
+                        for cell in gap
+                    ):
+                        row_output.extend(cell.char for cell in gap)
+                    else:
+                        row_output.append(f"\033[{len(gap)}C")
+
+                char_style = (char.fg_color, char.bg_color)
+                if char_style != style:
+                    # Resetting the previous style shares one sequence with
+                    # selecting the new one.
+                    prefix = sgr_prefix(*char_style, reset=style_active)
+                    if prefix:
+                        row_output.append(prefix)
+                    style = char_style
+                    style_active = char_style != (None, None)
+
+                row_output.append(char.char)
+                # Only a single codepoint reliably advances the terminal by
+                # one column. After any other glyph the cursor column is
+                # unknown, so the next change is positioned absolutely.
+                cursor_x = x + 1 if len(char.char) == 1 else -1
+
+            output.append("".join(row_output))
+
+        if style_active:
+            output.append(SGR_RESET)
+
+        for y, (start_x, end_x) in dirty_rows:
+            self.previous_frame[y][start_x:end_x] = self.current_frame[y][start_x:end_x]
+
+        self.dirty_rows.clear()
         return output
 
 
@@ -223,6 +321,8 @@ class Renderer:
         """The terminal driver instance for rendering output."""
         self.frame_buffer = FrameBuffer(self.initial_width, self.initial_height)
         """The frame buffer instance for rendering the screen."""
+        self._rendered_version: Optional[tuple[int, int]] = None
+        """The DOM structure and dirty versions at the last widget pass."""
 
     def check_resize(self) -> bool:
         """Check if the terminal size has changed and update accordingly.
@@ -235,17 +335,18 @@ class Renderer:
             self.frame_buffer.width,
             self.frame_buffer.height,
         ):
-            self.frame_buffer = FrameBuffer(
-                new_width, new_height, self.frame_buffer.background_color
-            )
+            # The existing buffer is resized rather than replaced, so it keeps
+            # its background and inline settings. Piping the screen already
+            # resizes it, so the frames are only built once.
             if app.current_screen:
                 app.current_screen.width = new_width
                 app.current_screen.height = new_height
 
+                # pipe() also clears the terminal.
                 self.pipe(app.current_screen)
-
-            app.driver.write("\033[H\033[J")
-            self.frame_buffer.mark_entire_screen_dirty()
+            else:
+                self.frame_buffer.set_size(new_width, new_height)
+                self.driver.write("\033[H\033[J")
 
             return True
         return False
@@ -263,8 +364,11 @@ class Renderer:
         self.frame_buffer.set_size(screen.width, screen.height)
         self.frame_buffer.set_background_color(screen.background_color)
         self.frame_buffer.inline = screen.inline
+        self._rendered_version = None
 
-        self.clear()
+        # set_size() already left both frames blank, so only the terminal
+        # needs clearing; the diff then draws just what the screen renders.
+        self.driver.write("\033[H\033[J")
 
     def render(self) -> None:
         """Render all widgets to the terminal.
@@ -277,16 +381,24 @@ class Renderer:
 
         self.dom_tree.arrange_all_widgets()
 
-        for node in self.dom_tree.get_node_list():
-            if not isinstance(node, Widget) or node.dirty is False:
-                continue
+        # No node has been added, removed or marked dirty since the last pass,
+        # so there is nothing to draw. Anything marked dirty during the pass
+        # changes the version and is picked up next frame.
+        version = (DOMNode.structure_version, DOMNode.dirty_version)
+        if version != self._rendered_version:
+            self._rendered_version = version
+            for node in self.dom_tree.get_node_list():
+                if not isinstance(node, Widget) or node.dirty is False:
+                    continue
 
-            self.frame_buffer.draw_content(node.region, node.render())
-            node.dirty = False
+                self.frame_buffer.draw_content(node.region, node.render())
+                node.dirty = False
 
+        # Send the whole frame as one payload: the writer thread then encodes
+        # it once and hands it to the terminal in a single write.
         output = self.frame_buffer.get_rendered_output()
-        for line in output:
-            self.driver.write(line)
+        if output:
+            self.driver.write("".join(output))
 
     def clear(self) -> None:
         """Clear the renderer's current frame and terminal display."""
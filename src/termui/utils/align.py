@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Callable, Literal
 
 from termui.errors import AlignmentError
 
@@ -6,6 +6,41 @@ HorizontalAlignment = Literal["left", "center", "right"]
 VerticalAlignment = Literal["top", "middle", "bottom"]
 
 
+_HORIZONTAL_OFFSETS: dict[str, Callable[[int, int], int]] = {
+    "left": lambda content_width, region_width: 0,
+    "center": lambda content_width, region_width: (region_width - content_width) // 2,
+    "right": lambda content_width, region_width: region_width - content_width,
+}
+"""Functions mapping (content_width, region_width) to a start x, keyed by alignment."""
+
+_VERTICAL_OFFSETS: dict[str, Callable[[int], int]] = {
+    "top": lambda region_height: 0,
+    "middle": lambda region_height: (region_height - 1) // 2,
+    "bottom": lambda region_height: region_height - 1,
+}
+"""Functions mapping region_height to a start y, keyed by alignment."""
+
+
+def get_horizontal_aligner(alignment: HorizontalAlignment) -> Callable[[int, int], int]:
+    """
+    Get the function that calculates the starting x position for an alignment.
+
+    Resolving the alignment once lets callers align many lines without
+    re-checking the alignment type for each one.
+
+    Args:
+        alignment (HorizontalAlignment): The alignment type ('left', 'center', 'right').
+
+    Returns:
+        Callable[[int, int], int]: A function taking (content_width, region_width)
+        and returning the starting x position for the content.
+    """
+    try:
+        return _HORIZONTAL_OFFSETS[alignment]
+    except KeyError as e:
+        raise AlignmentError(f"Invalid alignment type: {alignment}") from e
+
+
 def get_aligned_start_x(
     content: str, region_width: int, alignment: HorizontalAlignment
 ) -> int:
@@ -20,16 +55,7 @@ def get_aligned_start_x(
     Returns:
         int: The starting x position for the content.
     """
-    content_width = len(content)
-    match alignment:
-        case "left":
-            return 0
-        case "center":
-            return (region_width - content_width) // 2
-        case "right":
-            return region_width - content_width
-        case _:
-            raise AlignmentError(f"Invalid alignment type: {alignment}")
+    return get_horizontal_aligner(alignment)(len(content), region_width)
 
 
 def get_aligned_start_y(region_height: int, alignment: VerticalAlignment) -> int:
@@ -43,12 +69,7 @@ def get_aligned_start_y(region_height: int, alignment: VerticalAlignment) -> int
     Returns:
         int: The starting y position for the content.
     """
-    match alignment:
-        case "top":
-            return 0
-        case "middle":
-            return (region_height - 1) // 2
-        case "bottom":
-            return region_height - 1
-        case _:
-            raise AlignmentError(f"Invalid alignment type: {alignment}")
+    try:
+        return _VERTICAL_OFFSETS[alignment](region_height)
+    except KeyError as e:
+        raise AlignmentError(f"Invalid alignment type: {alignment}") from e
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Literal, Optional
 
 from termui.char import Char
@@ -31,6 +32,11 @@ BorderStyle = Literal[
 ]
 """The character style to use for the border"""
 
+_BORDER_CHARS: dict[str, tuple[str, ...]] = {
+    style.name.lower(): style.value for style in BorderStyleChars
+}
+"""Border character sets keyed by BorderStyle, resolved once at import time."""
+
 
 def draw_rectangle(
     width: int,
@@ -41,6 +47,7 @@ def draw_rectangle(
     title: Optional[str] = None,
     title_alignment: HorizontalAlignment = "left",
     fill: str | Char = " ",
+    out: Optional[list[list[Char]]] = None,
 ) -> list[list[Char]]:
     """Draw a rectangle with the specified width, height, and border style.
 
@@ -53,14 +60,65 @@ def draw_rectangle(
         title: The title text to display (default: None).
         title_alignment: The alignment of the title text (default: "left").
         fill: The character or Char object to use for filling the rectangle (default: " ").
+        out: A previously drawn rectangle to draw into. It is reused in place when
+            it has the same dimensions, otherwise a new rectangle is allocated.
     """
     if width < 2 or height < 2:
         raise DimensionError("Width and height must be at least 2.")
 
-    tl, tr, bl, br, lv, rv, th, bh = BorderStyleChars[border_style.upper()].value
     fill_char = Char(fill, None, None) if isinstance(fill, str) else fill
+    top_line, middle_line, bottom_line = _border_rows(
+        width,
+        border_style,
+        border_color,
+        title_color,
+        title,
+        title_alignment,
+        fill_char,
+    )
+
+    if out is not None and len(out) == height and all(len(row) == width for row in out):
+        out[0][:] = top_line
+        for row in out[1:-1]:
+            row[:] = middle_line
+        out[-1][:] = bottom_line
+        return out
+
+    rectangle: list[list[Char]] = [list(top_line)]
+    rectangle.extend(list(middle_line) for _ in range(height - 2))
+    rectangle.append(list(bottom_line))
+
+    return rectangle
+
 
-    rectangle: list[list[Char]] = []
+@lru_cache(maxsize=64)
+def _border_rows(
+    width: int,
+    border_style: BorderStyle,
+    border_color: Color,
+    title_color: Color,
+    title: Optional[str],
+    title_alignment: HorizontalAlignment,
+    fill_char: Char,
+) -> tuple[tuple[Char, ...], tuple[Char, ...], tuple[Char, ...]]:
+    """Build the top, middle and bottom rows of a rectangle.
+
+    The rows only depend on the arguments, so they are cached and shared
+    between calls. Callers must copy a row before modifying it.
+
+    Args:
+        width: The width of the rectangle.
+        border_style: The style of the border.
+        border_color: The color of the border.
+        title_color: The color of the title text.
+        title: The title text to display, if any.
+        title_alignment: The alignment of the title text.
+        fill_char: The character used to fill the inside of the rectangle.
+
+    Returns:
+        A tuple (top_line, middle_line, bottom_line) of immutable rows.
+    """
+    tl, tr, bl, br, lv, rv, th, bh = _BORDER_CHARS[border_style]
 
     top_line = (
         [Char(tl, border_color)]
@@ -73,19 +131,15 @@ def draw_rectangle(
 
         for i, char in enumerate(title_text):
             top_line[start_x + i + 1] = Char(char, title_color)
-    rectangle.append(top_line)
 
-    for _ in range(height - 2):
-        rectangle.append(
-            [Char(lv, border_color)]
-            + [fill_char] * (width - 2)
-            + [Char(rv, border_color)]
-        )
+    middle_line = (
+        [Char(lv, border_color)] + [fill_char] * (width - 2) + [Char(rv, border_color)]
+    )
 
-    rectangle.append(
+    bottom_line = (
         [Char(bl, border_color)]
         + [Char(bh, border_color)] * (width - 2)
         + [Char(br, border_color)]
     )
 
-    return rectangle
+    return tuple(top_line), tuple(middle_line), tuple(bottom_line)
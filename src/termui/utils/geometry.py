@@ -4,7 +4,7 @@ from typing import Iterator
 from termui.errors import DimensionError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Size:
     """Represents the size of a 2D area.
 
@@ -30,7 +30,31 @@ class Size:
         yield self.height
 
 
-@dataclass
+def _check_coordinates(x: int, y: int) -> None:
+    """Validate the coordinates of a region.
+
+    Raises:
+        DimensionError: If either coordinate is negative.
+    """
+    if x < 0 or y < 0:
+        raise DimensionError(
+            f"Region coordinates ({x}, {y}) are negative. Region must have non-negative coordinates."
+        )
+
+
+def _check_dimensions(width: int, height: int) -> None:
+    """Validate the dimensions of a region.
+
+    Raises:
+        DimensionError: If either dimension is negative.
+    """
+    if width < 0 or height < 0:
+        raise DimensionError(
+            f"Region dimensions ({width}, {height}) are non-positive. Region must have positive dimensions."
+        )
+
+
+@dataclass(slots=True)
 class Region:
     """Represents a rectangular region in 2D space.
 
@@ -49,15 +73,8 @@ class Region:
     """Dimensions of the region"""
 
     def __post_init__(self):
-        if self.x < 0 or self.y < 0:
-            raise DimensionError(
-                f"Region coordinates ({self.x}, {self.y}) are negative. Region must have non-negative coordinates."
-            )
-
-        if self.width < 0 or self.height < 0:
-            raise DimensionError(
-                f"Region dimensions ({self.width}, {self.height}) are non-positive. Region must have positive dimensions."
-            )
+        _check_coordinates(self.x, self.y)
+        _check_dimensions(self.width, self.height)
 
     def __str__(self):
         return (
@@ -76,6 +93,34 @@ class Region:
         """
         return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
 
+    def set_position(self, x: int, y: int) -> None:
+        """Move the region to the absolute position (x, y) in place.
+
+        Args:
+            x: The new x-coordinate of the region.
+            y: The new y-coordinate of the region.
+
+        Raises:
+            DimensionError: If either coordinate is negative.
+        """
+        _check_coordinates(x, y)
+        self.x = x
+        self.y = y
+
+    def set_size(self, width: int, height: int) -> None:
+        """Update the dimensions of the region in place.
+
+        Args:
+            width: The new width of the region.
+            height: The new height of the region.
+
+        Raises:
+            DimensionError: If either dimension is negative.
+        """
+        _check_dimensions(width, height)
+        self.width = width
+        self.height = height
+
     def move_relative(self, dx: int, dy: int) -> "Region":
         """Move the region by dx and dy.
 
@@ -57,7 +57,9 @@ class Widget(DOMNode, ABC):
             x: The x-coordinate to position the widget at.
             y: The y-coordinate to position the widget at.
         """
-        self.region.move_absolute(x, y)
+        if x == self.region.x and y == self.region.y:
+            return
+        self.region.set_position(x, y)
 
     def set_size(self, width: int, height: int) -> None:
         """Set the widget's size.
@@ -66,7 +68,9 @@ class Widget(DOMNode, ABC):
             width: The width to set for the widget.
             height: The height to set for the widget.
         """
-        self.region.update_dimensions(width, height)
+        if width == self.region.width and height == self.region.height:
+            return
+        self.region.set_size(width, height)
 
     def get_minimum_size(self) -> tuple[int, int]:
         """Get the minimum size required for this widget.
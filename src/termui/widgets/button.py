@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Callable, Literal, Optional
 
-from termui.char import Char
+from termui.char import Char, get_char
 from termui.color import Color
 from termui.events import MouseDown, MouseUp
 from termui.utils.align import get_aligned_start_x, get_aligned_start_y
@@ -173,6 +173,9 @@ class Button(Widget):
         self.state: ButtonState = state
         """Current state of the button."""
 
+        self._colors_cache: Optional[tuple[tuple, tuple]] = None
+        """The last derived colors and the style, color and state values they were derived for."""
+
         self.set_size(*self.get_minimum_size())
 
     def __call__(
@@ -251,6 +254,29 @@ class Button(Widget):
             A tuple (border_fg, border_bg, text_fg, text_bg) containing
             the colors to use for rendering the button in its current state.
         """
+        # The variants are mutable, so the key holds their field values rather
+        # than the variants themselves. Colors are frozen and safe to keep.
+        key = (
+            self.style.name,
+            self.style.border_style,
+            self.style.fill_char,
+            self.color.fg_color,
+            self.color.bg_color,
+            self.state,
+        )
+        if self._colors_cache is not None and self._colors_cache[0] == key:
+            return self._colors_cache[1]
+
+        colors = self._calculate_colors()
+        self._colors_cache = (key, colors)
+        return colors
+
+    def _calculate_colors(self) -> tuple[Color, Color, Color, Color | None]:
+        """Derive the colors for the current style and state.
+
+        Returns:
+            A tuple (border_fg, border_bg, text_fg, text_bg).
+        """
         fg = self.color.fg_color
         bg = self.color.bg_color
         text_fg = fg
@@ -346,15 +372,11 @@ class Button(Widget):
                 case "large":
                     depth_char_top = "▅"
                     depth_char_bottom = "▃"
-            for char in content[0]:
-                char.char = depth_char_top
-                char.bg_color = bg.lighten(0.1)
-            for char in content[-1]:
-                char.char = depth_char_bottom
-                char.fg_color = bg.darken(0.1)
-                char.bg_color = bg
+            width = len(content[0])
+            content[0] = [Char(depth_char_top, bg, bg.lighten(0.1))] * width
+            content[-1] = [Char(depth_char_bottom, bg.darken(0.1), bg)] * width
 
-        text_line: list[Char] = [Char(c, text_fg, text_bg) for c in self.label]
+        text_line: list[Char] = [get_char(c, text_fg, text_bg) for c in self.label]
 
         text_start_x = get_aligned_start_x(
             self.label,
@@ -363,8 +385,12 @@ class Button(Widget):
         )
         text_start_y = get_aligned_start_y(self.region.height, "middle")
 
-        for i, char in enumerate(text_line):
-            content[text_start_y][text_start_x + i] = char
+        # Clip the label to the row and write it with a single slice assignment.
+        row = content[text_start_y]
+        start = max(text_start_x, 0)
+        end = min(len(row), text_start_x + len(text_line))
+        if start < end:
+            row[start:end] = text_line[start - text_start_x : end - text_start_x]
 
         return content
 
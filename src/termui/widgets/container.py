@@ -52,6 +52,8 @@ class Container(Widget):
 
         self._root_layout: Layout = VerticalLayout()
         """The root layout object for the container"""
+        self._buffer: Optional[list[list[Char]]] = None
+        """The rendered rows from the previous frame, reused when the size is unchanged."""
 
         self.set_size(*self.get_minimum_size())
 
@@ -82,6 +84,14 @@ class Container(Widget):
 
     def get_content_region(self) -> Region:
         """Get the region available for content (inside border and padding)."""
+        return Region(*self._get_content_bounds())
+
+    def _get_content_bounds(self) -> tuple[int, int, int, int]:
+        """Get the bounds available for content without allocating a Region.
+
+        Returns:
+            tuple[int, int, int, int]: The (x, y, width, height) of the content area.
+        """
         border_offset = 1 if self.border_style != "none" else 0
 
         content_x = border_offset + self.padding[3]
@@ -93,7 +103,7 @@ class Container(Widget):
             self.region.height - (border_offset * 2) - self.padding[0] - self.padding[2]
         )
 
-        return Region(
+        return (
             self.region.x + content_x,
             self.region.y + content_y,
             max(0, content_width),
@@ -105,11 +115,11 @@ class Container(Widget):
         if not self._root_layout:
             return
 
-        content_region = self.get_content_region()
+        x, y, width, height = self._get_content_bounds()
 
-        if content_region.width > 0 and content_region.height > 0:
-            self._root_layout.set_position(content_region.x, content_region.y)
-            self._root_layout.set_size(content_region.width, content_region.height)
+        if width > 0 and height > 0:
+            self._root_layout.set_position(x, y)
+            self._root_layout.set_size(width, height)
             self._root_layout.arrange()
 
     def set_size(self, width: int, height: int) -> None:
@@ -119,6 +129,8 @@ class Container(Widget):
             width (int): The new width of the container.
             height (int): The new height of the container.
         """
+        if width == self.region.width and height == self.region.height:
+            return
         super().set_size(width, height)
         self._arrange_content()
 
@@ -129,6 +141,8 @@ class Container(Widget):
             x (int): The new x-coordinate of the container.
             y (int): The new y-coordinate of the container.
         """
+        if x == self.region.x and y == self.region.y:
+            return
         super().set_position(x, y)
         self._arrange_content()
 
@@ -156,7 +170,7 @@ class Container(Widget):
         """
         self._arrange_content()
 
-        content = draw_rectangle(
+        content = self._buffer = draw_rectangle(
             self.region.width,
             self.region.height,
             border_style=self.border_style,
@@ -164,6 +178,7 @@ class Container(Widget):
             title=self.title,
             title_color=self.title_color,
             title_alignment=self.title_alignment,
+            out=self._buffer,
         )
 
         if not self._root_layout and not self._root_layout.children:
@@ -187,13 +202,12 @@ class Container(Widget):
                     if y_pos < 0 or y_pos >= len(content):
                         continue
 
-                    for col_idx, char in enumerate(row):
-                        x_pos = rel_x + col_idx
-
-                        if x_pos < 0 or x_pos >= len(content[y_pos]):
-                            continue
-
-                        content[y_pos][x_pos] = char
+                    # Clip the child row to the container and copy it in one slice.
+                    target_row = content[y_pos]
+                    start = max(0, -rel_x)
+                    end = min(len(row), len(target_row) - rel_x)
+                    if start < end:
+                        target_row[rel_x + start : rel_x + end] = row[start:end]
             except Exception as e:
                 raise e
 
@@ -244,7 +258,7 @@ class Container(Widget):
         """
         if self._root_layout and self._root_layout.children:
             old_children = list(self._root_layout.children)
-            self._root_layout.children.clear()
+            self._root_layout.clear_children()
 
             for child in old_children:
                 layout.add_child(child)
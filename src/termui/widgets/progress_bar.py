@@ -1,6 +1,6 @@
 from typing import Literal, Optional
 
-from termui.char import Char
+from termui.char import Char, get_char
 from termui.color import Color
 from termui.widget import Widget
 
@@ -53,6 +53,9 @@ class ProgressBar(Widget):
         self.bg_color = bg_color
         """The background color of the progress bar."""
 
+        self._render_cache: Optional[tuple[tuple, list[list[Char]]]] = None
+        """The last rendered output and the inputs it was rendered from."""
+
         self.set_size(*self.get_minimum_size())
 
     def get_minimum_size(self) -> tuple[int, int]:
@@ -93,33 +96,57 @@ class ProgressBar(Widget):
         self.set_value(self.current_value - amount)
 
     def render(self) -> list[list[Char]]:
-        """Render the button to a 2D character array.
+        """Render the progress bar to a 2D character array.
+
+        The output is cached and returned as-is while the value, label and
+        colors are unchanged, so it must not be modified by the caller.
+
+        Returns:
+            A 2D list of Char objects representing the progress bar.
+        """
+        key = (
+            self.current_value,
+            self.max_value,
+            self.label,
+            self.label_pos,
+            self.label_color,
+            self.fg_color,
+            self.bg_color,
+        )
+        if self._render_cache is not None and self._render_cache[0] == key:
+            return self._render_cache[1]
+
+        rendered_content = self._render_content()
+        self._render_cache = (key, rendered_content)
+        return rendered_content
+
+    def _render_content(self) -> list[list[Char]]:
+        """Render the progress bar without consulting the cache.
 
         Returns:
-            A 2D list of Char objects representing the button's appearance
-            with proper colors, borders, text, and visual effects.
+            A 2D list of Char objects representing the progress bar.
         """
         bar_length = 40
         filled_length = int(bar_length * self.current_value // self.max_value)
         bar_string = (
-            [Char("█", self.fg_color, self.bg_color)] * filled_length
-            + [Char("─", Color(255, 255, 255), self.bg_color)]
+            [get_char("█", self.fg_color, self.bg_color)] * filled_length
+            + [get_char("─", Color(255, 255, 255), self.bg_color)]
             * (bar_length - filled_length - 1)
-            + [Char("┤", Color(255, 255, 255), self.bg_color)]
+            + [get_char("┤", Color(255, 255, 255), self.bg_color)]
         )
 
         bar_label = (
-            [Char(char, self.label_color, self.bg_color) for char in self.label]
+            [get_char(char, self.label_color, self.bg_color) for char in self.label]
             if self.label
             else []
         )
 
         bar_amount = [
-            Char(char, self.label_color, self.bg_color)
+            get_char(char, self.label_color, self.bg_color)
             for char in f"{self.current_value}/{self.max_value}"
         ]
 
-        space = [Char(" ", self.label_color, self.bg_color)]
+        space = [get_char(" ", self.label_color, self.bg_color)]
 
         match self.label_pos:
             case "left":
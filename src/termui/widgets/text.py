@@ -1,17 +1,54 @@
-from typing import Optional
+from typing import Optional, Sequence
 
-from termui.char import Char
+from termui.char import Char, get_char
 from termui.color import Color
-from termui.utils.align import HorizontalAlignment, get_aligned_start_x
+from termui.utils.align import (
+    HorizontalAlignment,
+    get_aligned_start_x,
+    get_horizontal_aligner,
+)
 from termui.widget import Widget
 
+TextContent = str | Sequence[str | Sequence[str]]
+"""Text content: a single line, or a sequence of lines given as strings or characters."""
+
+
+def _to_lines(content: TextContent) -> list[str]:
+    """Normalise text content into a list of lines.
+
+    Lines given as sequences of characters are joined in a single pass.
+
+    Args:
+        content: The content to normalise.
+
+    Returns:
+        list[str]: The content as a list of lines.
+    """
+    if isinstance(content, str):
+        return [content]
+    return [line if isinstance(line, str) else "".join(line) for line in content]
+
+
+def _measure(lines: list[str]) -> tuple[int, int]:
+    """Measure the size needed to display lines of text without truncation.
+
+    Args:
+        lines: The lines to measure.
+
+    Returns:
+        tuple[int, int]: The (width, height) in characters.
+    """
+    if not lines:
+        return 1, 1
+    return max(len(line) for line in lines), len(lines)
+
 
 class Text(Widget):
     """A widget that displays text."""
 
     def __init__(
         self,
-        content: str | list[str],
+        content: TextContent,
         fg_color: Color = Color(255, 255, 255),
         bg_color: Optional[Color] = None,
         align: HorizontalAlignment = "left",
@@ -21,7 +58,7 @@ class Text(Widget):
 
         Args:
             content: The text content to display. Single strings become one line,
-                    lists of strings become multiple lines.
+                    lists of strings (or of character lists) become multiple lines.
             fg_color: The foreground color of the text (default: white).
             bg_color: The background color of the text (default: None).
             align: The alignment of the text (default: left).
@@ -29,8 +66,10 @@ class Text(Widget):
         """
         super().__init__(name=kwargs.get("name", "Text"), **kwargs)
 
-        self.content: list[str] = content if isinstance(content, list) else [content]
-        """The text content to display."""
+        self._content: list[str] = _to_lines(content)
+        """The lines of text content to display."""
+        self._minimum_size: Optional[tuple[tuple[str, ...], tuple[int, int]]] = None
+        """The last measured minimum size and the lines it was measured from."""
         self.fg_color: Color = fg_color
         """The foreground color of the text."""
         self.bg_color: Optional[Color] = bg_color
@@ -39,22 +78,34 @@ class Text(Widget):
         self.align: HorizontalAlignment = align
         """How the content should be aligned horizontally."""
 
+        self._render_cache: Optional[tuple[tuple, list[list[Char]]]] = None
+        """The last rendered output and the inputs it was rendered from."""
+
         self.set_size(*self.get_minimum_size())
 
+    @property
+    def content(self) -> list[str]:
+        """The text content to display, as a list of lines."""
+        return self._content
+
+    @content.setter
+    def content(self, content: TextContent) -> None:
+        self._content = _to_lines(content)
+
     def get_minimum_size(self) -> tuple[int, int]:
         """Get the minimum size required to display the text content.
 
         Calculates the smallest possible dimensions that can accommodate all
-        text without truncation.
+        text without truncation. The result is reused until the lines change,
+        whether they are replaced or edited in place.
 
         Returns:
             tuple[int, int]: Minimum (width, height) in characters.
         """
-        if not self.content:
-            return 1, 1
-        width = max(len(line) for line in self.content)
-        height = max(len(self.content), 1)
-        return width, height
+        lines = tuple(self._content)
+        if self._minimum_size is None or self._minimum_size[0] != lines:
+            self._minimum_size = (lines, _measure(self._content))
+        return self._minimum_size[1]
 
     def get_content(self) -> list[str]:
         """Get the current text content.
@@ -64,7 +115,7 @@ class Text(Widget):
         """
         return self.content
 
-    def set_content(self, content: str | list[str]) -> None:
+    def set_content(self, content: TextContent) -> None:
         """Update the text content and recalculate widget size.
 
         Changes the displayed text content and automatically adjusts the widget
@@ -74,29 +125,69 @@ class Text(Widget):
         Args:
             content: The new text content to display.
         """
-        self.content = content if isinstance(content, list) else [content]
+        self.content = content
         self.mark_dirty()
 
     def render(self) -> list[list[Char]]:
         """Render the text with its border and children.
 
+        The output is cached and returned as-is while the size, lines and
+        styling are unchanged, so it must not be modified by the caller.
+
         Returns:
             list[list[Char]]: The rendered content of the text widget.
         """
-        rendered_content: list[list[Char]] = [[] for _ in range(self.region.height)]
-
-        for i in range(self.region.height):
-            rendered_line: list[Char] = [Char("") for _ in range(self.region.width)]
+        key = (
+            self.region.width,
+            self.region.height,
+            tuple(self._content),
+            self.fg_color,
+            self.bg_color,
+            self.align,
+        )
+        if self._render_cache is not None and self._render_cache[0] == key:
+            return self._render_cache[1]
+
+        rendered_content = self._render_content()
+        self._render_cache = (key, rendered_content)
+        return rendered_content
 
-            line = self.content[i] if i < len(self.content) else ""
+    def _render_content(self) -> list[list[Char]]:
+        """Render the text content into rows of characters.
 
-            start_x = get_aligned_start_x(line, self.region.width, self.align)
+        Returns:
+            list[list[Char]]: The rendered content of the text widget.
+        """
+        if not any(self.content):
+            # Placeholder text: every row is the same blank line.
+            start_x = get_aligned_start_x("", self.region.width, self.align)
+            blank_line = [Char("")] * start_x + [
+                Char(" ", self.fg_color, self.bg_color)
+            ] * (self.region.width - start_x)
+            return [list(blank_line) for _ in range(self.region.height)]
+
+        width = self.region.width
+        aligned_start_x = get_horizontal_aligner(self.align)
+        padding_char = Char("")
+        blank_char = get_char(" ", self.fg_color, self.bg_color)
+        rendered_content: list[list[Char]] = []
+
+        # All text shares one style, so each distinct glyph only needs one Char.
+        glyphs: dict[str, Char] = {" ": blank_char}
 
-            for j in range(self.region.width - start_x):
-                char = line[j] if j < len(line) else " "
-                rendered_char = Char(char, self.fg_color, self.bg_color)
-                rendered_line[start_x + j] = rendered_char
+        for i in range(self.region.height):
+            line = self.content[i] if i < len(self.content) else ""
 
-            rendered_content[i] = rendered_line
+            start_x = aligned_start_x(len(line), width)
+            padding = max(start_x, 0)
+            visible = line[padding - start_x : width - start_x]
+            for char in set(visible).difference(glyphs):
+                glyphs[char] = get_char(char, self.fg_color, self.bg_color)
+
+            rendered_content.append(
+                [padding_char] * padding
+                + list(map(glyphs.__getitem__, visible))
+                + [blank_char] * (width - padding - len(visible))
+            )
 
         return rendered_content
@@ -0,0 +1,41 @@
+from dataclasses import replace
+
+from termui.color import Color
+from termui.widgets import Button
+
+
+def test_state_change_invalidates_colors():
+    button = Button("Click", "solid primary small")
+    default_colors = button._get_colors()
+
+    button._on_mouse_enter()
+    hovered_colors = button._get_colors()
+    assert hovered_colors != default_colors
+
+    button._on_mouse_exit()
+    assert button._get_colors() == default_colors
+
+
+def test_in_place_color_change_invalidates_colors():
+    button = Button("Click", "solid primary small")
+    # The variants are shared between buttons, so edit a private copy.
+    button.color = replace(button.color)
+    button._get_colors()
+
+    button.color.fg_color = Color(1, 2, 3)
+    button.color.bg_color = Color(4, 5, 6)
+
+    assert button._get_colors()[:2] == (Color(1, 2, 3), Color(4, 5, 6))
+
+
+def test_style_change_invalidates_colors():
+    button = Button("Click", "solid primary small")
+    button._get_colors()
+
+    button(style="outline success small")
+
+    assert button._get_colors()[:2] == (
+        button.color.fg_color,
+        button.color.bg_color,
+    )
+    assert button.render()[0][0].fg_color == button.color.bg_color
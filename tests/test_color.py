@@ -0,0 +1,21 @@
+from termui.color import Color, sgr_prefix
+
+
+def test_sgr_prefix_depends_on_every_argument():
+    red, blue = Color(255, 0, 0), Color(0, 0, 255)
+
+    assert sgr_prefix(red) == "\033[38;2;255;0;0m"
+    assert sgr_prefix(blue) == "\033[38;2;0;0;255m"
+    assert sgr_prefix(None, blue) == "\033[48;2;0;0;255m"
+    assert sgr_prefix(red, blue, reset=True) == "\033[0;38;2;255;0;0;48;2;0;0;255m"
+    assert sgr_prefix() == ""
+
+
+def test_sgr_prefix_cache_is_bounded():
+    sgr_prefix.cache_clear()
+    for value in range(5000):
+        sgr_prefix(Color(value % 256, value // 256, 0))
+
+    info = sgr_prefix.cache_info()
+    assert info.maxsize is not None
+    assert info.currsize <= info.maxsize
@@ -0,0 +1,72 @@
+from termui.dom_tree import DOMTree
+from termui.layouts import VerticalLayout
+from termui.widgets import Container, Text
+
+
+def _build_tree() -> tuple[DOMTree, VerticalLayout, Text]:
+    root = VerticalLayout()
+    first = Text("first")
+    root.add_child(first)
+    tree = DOMTree()
+    tree.set_root(root)
+    return tree, root, first
+
+
+def test_node_list_is_rebuilt_after_structure_change():
+    tree, root, first = _build_tree()
+    assert tree.get_node_list() == [root, first]
+    assert tree.get_node_list() is tree.get_node_list()
+
+    second = Text("second")
+    tree.add_node(root, second)
+    assert tree.get_node_list() == [root, first, second]
+
+    root.remove_child(first)
+    assert tree.get_node_list() == [root, second]
+
+    root.clear_children()
+    assert tree.get_node_list() == [root]
+
+
+def test_node_list_is_rebuilt_for_new_root():
+    tree, root, first = _build_tree()
+    tree.get_node_list()
+
+    other = VerticalLayout()
+    tree.set_root(other)
+
+    assert tree.get_node_list() == [other]
+
+
+def test_hit_test_is_rebuilt_after_structure_change():
+    tree, root, first = _build_tree()
+    first.set_position(0, 0)
+    first.set_size(5, 1)
+    assert tree.get_widget_at_coordinate(0, 0) is first
+
+    root.remove_child(first)
+    assert tree.get_widget_at_coordinate(0, 0) is None
+
+    container = Container()
+    second = Text("second")
+    container.add_child(second)
+    tree.add_node(root, container)
+    container.set_position(0, 0)
+    container.set_size(10, 3)
+    second.set_position(1, 1)
+    second.set_size(6, 1)
+
+    assert tree.get_widget_at_coordinate(1, 1) is second
+    assert tree.get_widget_at_coordinate(0, 0) is None
+
+
+def test_hit_test_follows_moved_widgets():
+    tree, root, first = _build_tree()
+    first.set_position(0, 0)
+    first.set_size(5, 1)
+    assert tree.get_widget_at_coordinate(0, 0) is first
+
+    first.set_position(10, 2)
+
+    assert tree.get_widget_at_coordinate(0, 0) is None
+    assert tree.get_widget_at_coordinate(10, 2) is first
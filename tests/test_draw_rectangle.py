@@ -0,0 +1,44 @@
+from termui.char import Char
+from termui.color import Color
+from termui.utils.draw_rectangle import draw_rectangle
+
+
+def _text(rectangle: list[list[Char]]) -> list[str]:
+    return ["".join(char.char for char in row) for row in rectangle]
+
+
+def test_changed_arguments_are_not_served_from_cache():
+    red = draw_rectangle(6, 3, border_color=Color(255, 0, 0))
+    blue = draw_rectangle(6, 3, border_color=Color(0, 0, 255))
+    assert red[0][0].fg_color == Color(255, 0, 0)
+    assert blue[0][0].fg_color == Color(0, 0, 255)
+
+    titled = draw_rectangle(6, 3, title="ab")
+    untitled = draw_rectangle(6, 3)
+    assert "ab" in _text(titled)[0]
+    assert "ab" not in _text(untitled)[0]
+
+
+def test_editing_a_rectangle_does_not_change_later_ones():
+    first = draw_rectangle(5, 4, fill=".")
+    first[0][1] = Char("x")
+    first[1][1] = Char("y")
+
+    second = draw_rectangle(5, 4, fill=".")
+
+    assert _text(second)[0][1] != "x"
+    assert _text(second)[1:3] == [_text(second)[1]] * 2
+    assert _text(second)[1][1] == "."
+
+
+def test_out_is_redrawn_in_place_or_replaced_on_resize():
+    out = draw_rectangle(5, 3, fill=".")
+    out[1][1] = Char("x")
+
+    redrawn = draw_rectangle(5, 3, fill=".", out=out)
+    assert redrawn is out
+    assert _text(out)[1][1] == "."
+
+    resized = draw_rectangle(6, 4, fill=".", out=out)
+    assert resized is not out
+    assert [len(row) for row in resized] == [6] * 4
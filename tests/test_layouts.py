@@ -0,0 +1,96 @@
+import pytest
+
+from termui.errors import LayoutError
+from termui.layouts import GridLayout, HorizontalLayout, VerticalLayout
+from termui.widgets import Text
+
+
+def _region(widget) -> tuple[int, int, int, int]:
+    region = widget.region
+    return region.x, region.y, region.width, region.height
+
+
+def _arranged(layout, *children):
+    for child in children:
+        layout.add_child(child)
+    layout.set_position(0, 0)
+    layout.set_size(20, 5)
+    layout.arrange()
+    return layout
+
+
+@pytest.mark.parametrize("layout_class", [HorizontalLayout, VerticalLayout])
+def test_linear_layout_rearranges_moved_child(layout_class):
+    child = Text("bbb")
+    layout = _arranged(layout_class(spacing=1), Text("aa"), child)
+    arranged = _region(child)
+
+    child.set_position(15, 3)
+    layout.arrange()
+
+    assert _region(child) == arranged
+
+
+def test_horizontal_layout_rearranges_on_resize():
+    child = Text("bbb")
+    layout = _arranged(HorizontalLayout(), child)
+
+    layout.set_size(30, 8)
+    layout.arrange()
+
+    assert _region(child) == (0, 0, 3, 8)
+
+
+def test_vertical_layout_rearranges_on_resize():
+    child = Text("bbb")
+    layout = _arranged(VerticalLayout(), child)
+
+    layout.set_size(30, 8)
+    layout.arrange()
+
+    assert _region(child) == (0, 0, 30, 1)
+
+
+def test_grid_layout_rearranges_moved_child():
+    child = Text("B", pos=(1, 2))
+    layout = _arranged(GridLayout(spacing=1), Text("A", pos=(1, 1)), child)
+    arranged = _region(child)
+
+    child.set_position(15, 4)
+    layout.arrange()
+
+    assert _region(child) == arranged
+
+
+def test_grid_layout_rearranges_when_child_grows():
+    first = Text("A", pos=(1, 1))
+    layout = _arranged(GridLayout(), first, Text("B", pos=(1, 2)))
+    assert _region(first) == (0, 0, 10, 5)
+
+    layout.set_size(3, 5)
+    first.set_content("AAA")
+    layout.arrange()
+
+    assert _region(first)[2] == 3
+
+
+def test_grid_layout_rejects_overlap_without_partial_placement():
+    layout = GridLayout()
+    layout.add_child(Text("A", pos=(3, 2)))
+    grid_map = dict(layout.grid_map)
+
+    with pytest.raises(LayoutError):
+        layout.add_child(Text("wide", pos=((2, 3), (1, 2))))
+
+    assert layout.grid_map == grid_map
+
+
+def test_grid_layout_call_is_all_or_nothing():
+    layout = GridLayout()
+    layout.add_child(Text("A", pos=(2, 2)))
+    grid_map = dict(layout.grid_map)
+
+    with pytest.raises(LayoutError):
+        layout(Text("B", pos=(1, 1)), Text("C", pos=(2, 2)))
+
+    assert layout.grid_map == grid_map
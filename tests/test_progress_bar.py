@@ -0,0 +1,34 @@
+from termui.color import Color
+from termui.widgets import ProgressBar
+
+
+def _amount(bar: ProgressBar) -> str:
+    return "".join(char.char for char in bar.render()[0]).rsplit(" ", 1)[-1]
+
+
+def test_set_value_invalidates_render():
+    bar = ProgressBar(10)
+    assert _amount(bar) == "10/100"
+
+    bar.set_value(70)
+    assert _amount(bar) == "70/100"
+
+    bar.increment(5)
+    assert _amount(bar) == "75/100"
+
+
+def test_unchanged_bar_reuses_render():
+    bar = ProgressBar(10)
+
+    assert bar.render() is bar.render()
+
+
+def test_attribute_change_invalidates_render():
+    bar = ProgressBar(50, label="Load")
+    assert "".join(char.char for char in bar.render()[0]).startswith("Load")
+
+    bar.label_pos = "right"
+    assert "".join(char.char for char in bar.render()[0]).endswith("Load")
+
+    bar.fg_color = Color(255, 0, 0)
+    assert bar.render()[0][0].fg_color == Color(255, 0, 0)
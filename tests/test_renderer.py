@@ -0,0 +1,116 @@
+from termui.char import Char
+from termui.dom_tree import DOMTree
+from termui.layouts import VerticalLayout
+from termui.renderer import FrameBuffer, Renderer
+from termui.utils.geometry import Region
+from termui.widgets import Text
+
+
+class FakeDriver:
+    """A driver that records what is written instead of using a terminal."""
+
+    def __init__(self) -> None:
+        self.output: list[str] = []
+
+    @staticmethod
+    def get_terminal_size() -> tuple[int, int]:
+        return 20, 4
+
+    def write(self, data: str) -> None:
+        self.output.append(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _renderer_for(*widgets: Text) -> tuple[Renderer, FakeDriver]:
+    root = VerticalLayout()
+    for widget in widgets:
+        root.add_child(widget)
+    root.set_position(0, 0)
+    root.set_size(20, 4)
+
+    tree = DOMTree()
+    tree.set_root(root)
+    tree.mark_layout_dirty()
+
+    driver = FakeDriver()
+    renderer = Renderer(driver)
+    renderer.dom_tree = tree
+    return renderer, driver
+
+
+def _frame(renderer: Renderer, driver: FakeDriver) -> str:
+    driver.output.clear()
+    renderer.render()
+    return "".join(driver.output)
+
+
+def test_idle_frame_skips_the_widget_pass(monkeypatch):
+    text = Text("hello")
+    renderer, driver = _renderer_for(text)
+    assert "hello" in _frame(renderer, driver)
+
+    calls = []
+    render = text.render
+    monkeypatch.setattr(text, "render", lambda: calls.append(1) or render())
+    text.dirty = True
+
+    assert _frame(renderer, driver) == ""
+    assert not calls
+
+
+def test_marked_dirty_widget_is_drawn_next_frame():
+    text = Text("hello")
+    renderer, driver = _renderer_for(text)
+    _frame(renderer, driver)
+
+    text.set_content("world")
+    assert "world" in _frame(renderer, driver)
+
+    text.set_content("world")
+    assert _frame(renderer, driver) == ""
+
+
+def test_structure_change_is_drawn_next_frame():
+    text = Text("hello")
+    renderer, driver = _renderer_for(text)
+    _frame(renderer, driver)
+
+    other = Text("other")
+    other.set_position(0, 2)
+    renderer.dom_tree.add_node(renderer.dom_tree.root, other)
+
+    assert "other" in _frame(renderer, driver)
+
+
+def test_unchanged_rows_are_not_marked_dirty():
+    frame_buffer = FrameBuffer(5, 2)
+    row = [Char("a"), Char("b")]
+    frame_buffer.draw_content(Region(0, 0, 2, 1), [row])
+    frame_buffer.get_rendered_output()
+
+    frame_buffer.draw_content(Region(0, 0, 2, 1), [list(row)])
+
+    assert not frame_buffer.dirty_rows
+    assert frame_buffer.get_rendered_output() == []
+
+
+def test_short_gap_is_rewritten():
+    frame_buffer = FrameBuffer(6, 1)
+    frame_buffer.draw_content(Region(0, 0, 3, 1), [[Char("e"), Char(" "), Char("x")]])
+
+    output = "".join(frame_buffer.get_rendered_output())
+
+    assert output == "\033[1;1He x"
+
+
+def test_change_after_combined_glyph_is_positioned_absolutely():
+    frame_buffer = FrameBuffer(6, 1)
+    frame_buffer.draw_content(
+        Region(0, 0, 3, 1), [[Char("e\u0301"), Char(" "), Char("x")]]
+    )
+
+    output = "".join(frame_buffer.get_rendered_output())
+
+    assert output == "\033[1;1He\u0301\033[1;3Hx"
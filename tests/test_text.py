@@ -0,0 +1,75 @@
+from termui.color import Color
+from termui.widgets import Text
+
+
+def _render_lines(text: Text) -> list[str]:
+    # Alignment padding is drawn as empty characters.
+    return ["".join(char.char or " " for char in row) for row in text.render()]
+
+
+def test_content_assignment_invalidates_render_and_size():
+    text = Text("hi")
+    text.set_size(5, 1)
+    assert _render_lines(text) == ["hi   "]
+
+    text.content = ["hello", "world!"]
+    text.set_size(6, 2)
+
+    assert text.get_minimum_size() == (6, 2)
+    assert _render_lines(text) == ["hello ", "world!"]
+
+
+def test_in_place_edit_invalidates_render_and_size():
+    text = Text(["ab", "cd"])
+    assert text.get_minimum_size() == (2, 2)
+    assert _render_lines(text) == ["ab", "cd"]
+
+    text.get_content()[1] = "cdef"
+    text.get_content().append("g")
+    text.set_size(4, 3)
+
+    assert text.get_minimum_size() == (4, 3)
+    assert _render_lines(text) == ["ab  ", "cdef", "g   "]
+
+
+def test_set_content_invalidates_render_and_size():
+    text = Text("one")
+    assert _render_lines(text) == ["one"]
+
+    text.set_content(["three", "4"])
+    text.set_size(5, 2)
+
+    assert text.dirty
+    assert text.get_minimum_size() == (5, 2)
+    assert _render_lines(text) == ["three", "4    "]
+
+
+def test_color_change_invalidates_render():
+    text = Text("hi", fg_color=Color(255, 0, 0))
+    assert text.render()[0][0].fg_color == Color(255, 0, 0)
+
+    text.fg_color = Color(0, 255, 0)
+    assert text.render()[0][0].fg_color == Color(0, 255, 0)
+
+    text.bg_color = Color(0, 0, 255)
+    assert text.render()[0][0].bg_color == Color(0, 0, 255)
+
+
+def test_align_change_invalidates_render():
+    text = Text("hi")
+    text.set_size(4, 1)
+    assert _render_lines(text) == ["hi  "]
+
+    text.align = "right"
+    assert _render_lines(text) == ["  hi"]
+
+    text.align = "center"
+    assert _render_lines(text) == [" hi "]
+    assert text.get_minimum_size() == (2, 1)
+
+
+def test_wide_line_is_clipped_when_aligned():
+    text = Text("abcdef", align="right")
+    text.set_size(4, 1)
+
+    assert len(text.render()[0]) == 4